@@ -0,0 +1,40 @@
+# Gunicorn settings, picked up automatically from the working directory
+import gc
+import os
+
+# Import app.py once in the master so workers share its read-only state
+# (compiled regexes, static HTML, config) copy-on-write
+preload_app = True
+
+# One process with many threads rather than many processes: the segment,
+# range and playlist caches and the admission limits are per process, so
+# every extra worker duplicates that memory and multiplies the origin fetch
+# ceiling (workers x MAX_UPSTREAM_FETCHES). Streams can still be served by any
+# worker (they are rebuilt from temp_hls/<stream_id>/), so WEB_CONCURRENCY can
+# raise this when one process's CPU is not enough.
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+
+# Threaded workers: one worker handles many requests at once, so the
+# upstream admission limits in app.py (global, per stream, wait queue)
+# actually apply. Keep threads above MAX_UPSTREAM_FETCHES so a surge hits
+# those limits and is shed with 503s, instead of queueing in gunicorn's
+# backlog until the worker times out. Rate-limited (paced) downloads sleep
+# between chunks, holding their thread for the whole transfer; each token
+# may only run RATE_LIMIT_MAX_DOWNLOADS of them at once, so a few download
+# managers opening many connections can't put every thread to sleep.
+# /api/admin/profile also relies on this: it samples the worker's other
+# threads while they serve live traffic.
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 48))
+
+
+def pre_fork(server, worker):
+    # Move everything created during preload out of the GC's generations so
+    # collections in the workers don't write to (and copy) those pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # Threads don't survive fork - start cleanup and snapshot threads per worker
+    from app import start_background_workers
+    start_background_workers()